@@ -1,4 +1,9 @@
 class HTMLNode:
+    # _props_html caches props_to_html() (None until first built; reset
+    # when props is assigned); _html memoizes the rendered string (see
+    # to_html in the subclasses)
+    __slots__ = ("tag", "value", "children", "_props", "_props_html", "_html")
+
     def __init__(self, tag=None, value=None, children=None, props=None):
         """
         Initializes an HTMLNode object.
@@ -12,7 +17,21 @@ class HTMLNode:
         self.tag = tag
         self.value = value
         self.children = children
-        self.props = props
+        self._props = props
+        self._props_html = None # Attribute string, built on first use
+        self._html = None # Rendered HTML, filled on first to_html()
+
+    @property
+    def props(self):
+        """dict[str, str] | None: The node's HTML attributes."""
+        return self._props
+
+    @props.setter
+    def props(self, props):
+        # Assigning new props invalidates the cached strings built from them
+        self._props = props
+        self._props_html = None
+        self._html = None
 
     def to_html(self):
         """
@@ -21,21 +40,63 @@ class HTMLNode:
         """
         raise NotImplementedError("Subclasses must implement this method")
 
+    def _render_into(self, write):
+        """
+        Writes this node's HTML through write (a callable taking a str).
+
+        ParentNode overrides this to stream its subtree without building
+        intermediate strings; by default the node's to_html() is written.
+        """
+        write(self.to_html())
+
+    def write_to(self, fp):
+        """
+        Writes this node's HTML to a text file object.
+
+        Same output as fp.write(self.to_html()), but a ParentNode's subtree
+        is streamed fragment by fragment instead of joined into one string.
+
+        Args:
+            fp: An object with a write(str) method (e.g. an open text file).
+        """
+        self._render_into(fp.write)
+
+    def invalidate(self):
+        """
+        Clears the memoized HTML of this node and all its descendants.
+
+        Nodes are treated as immutable once rendered; call this after
+        mutating a node (or its children) so the next to_html() re-renders.
+        """
+        # Explicit stack, like _render_into: no recursion per nesting level
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node._props_html = None
+            node._html = None
+            if node.children:
+                stack.extend(node.children)
+
     def props_to_html(self):
         """
         Converts the props dictionary into a string of HTML attributes.
+        The string is built on first use and cached on the node until props
+        is reassigned (or invalidate() is called).
 
         Returns:
             str: A string formatted as ' key1="value1" key2="value2"...',
                  or an empty string if no props exist.
         """
-        if not self.props:
-            return ""
-        html_props = []
-        for key, val in self.props.items():
-            html_props.append(f'{key}="{val}"')
-        # Important: Join with spaces and prepend a single leading space
-        return " " + " ".join(html_props)
+        props_html = self._props_html
+        if props_html is None:
+            props = self._props
+            if not props:
+                props_html = ""
+            else:
+                # Important: Join with spaces and prepend a single leading space
+                props_html = " " + " ".join(f'{key}="{val}"' for key, val in props.items())
+            self._props_html = props_html
+        return props_html
 
     def __repr__(self):
         """
@@ -53,6 +114,8 @@ class LeafNode(HTMLNode):
     Represents an HTML node with no children (a "leaf" in the HTML tree).
     Examples: <p>Text</p>, <a>Link</a>, <b>Bold</b>, raw text.
     """
+    __slots__ = ()
+
     def __init__(self, value, tag=None, props=None):
         """
         Initializes a LeafNode.
@@ -75,6 +138,7 @@ class LeafNode(HTMLNode):
     def to_html(self):
         """
         Renders the leaf node as an HTML string.
+        The result is memoized on the node; see invalidate().
 
         Returns:
             str: The HTML representation of the node.
@@ -82,21 +146,49 @@ class LeafNode(HTMLNode):
         Raises:
             ValueError: If the node's value is None.
         """
+        html = self._html
+        if html is not None:
+            return html
+
         # Rule 1: Raise ValueError if value is missing
         if self.value is None:
             # Although __init__ requires value, this check adheres to the specific
             # requirement for to_html to raise the error.
             raise ValueError("Invalid HTML: LeafNode requires a value.")
 
+        tag = self.tag # Load the attribute once
+        props_html = self.props_to_html()
         # Rule 2: Return raw text if tag is None
-        if self.tag is None:
-            return self.value
+        if tag is None:
+            html = self.value
+        elif not props_html:
+            # Rule 3: Render with HTML tag, no attributes (<b>, <code>, ...:
+            # the common shape); one f-string, a single allocation
+            html = f"<{tag}>{self.value}</{tag}>"
+        else:
+            # Rule 3 with attributes, props_html being e.g. ' href="..."'
+            html = f"<{tag}{props_html}>{self.value}</{tag}>"
 
-        # Rule 3: Render with HTML tag
-        # Get props string (e.g., ' href="..."') or empty string
-        props_html = self.props_to_html()
-        # Format: <tag props>value</tag>
-        return f"<{self.tag}{props_html}>{self.value}</{self.tag}>"
+        self._html = html
+        return html
+
+    def _clone_with_value(self, value):
+        """
+        Returns a new LeafNode with this node's tag and props but the given
+        value, without running __init__ (see the builders in textnode).
+
+        About twice as fast as LeafNode(value, tag): the slots are written
+        directly, reusing this node's attribute string. The clone shares
+        this node's props dict, so neither may mutate it in place.
+        """
+        new = object.__new__(self.__class__)
+        new.tag = self.tag
+        new.value = value
+        new.children = None
+        new._props = self._props
+        new._props_html = self._props_html
+        new._html = None
+        return new
 
     def __repr__(self):
         # Optional: Provide a slightly more specific repr for LeafNode
@@ -109,6 +201,8 @@ class ParentNode(HTMLNode):
     Represents an HTML node that contains other HTML nodes (children).
     Examples: <div><span>...</span></div>, <p><b>Bold</b> text.</p>
     """
+    __slots__ = ()
+
     def __init__(self, tag, children, props=None):
         """
         Initializes a ParentNode.
@@ -128,7 +222,9 @@ class ParentNode(HTMLNode):
 
     def to_html(self):
         """
-        Renders the parent node and its children as an HTML string recursively.
+        Renders the parent node and all its descendants as an HTML string.
+        The result is memoized on the node, so re-rendering a shared subtree
+        is O(1); see invalidate().
 
         Returns:
             str: The HTML representation of the node and its descendants.
@@ -138,28 +234,66 @@ class ParentNode(HTMLNode):
             ValueError: If the node's children list is missing (None).
                         An empty list [] is considered valid.
         """
-        # Rule 1: Raise ValueError if tag is missing
-        if not self.tag: # Checks for None or empty string
-             raise ValueError("Invalid HTML: ParentNode requires a tag.")
+        html = self._html
+        if html is not None:
+            return html
+
+        # Render the whole subtree into one flat buffer and join once here,
+        # rather than materializing (and re-copying) a string per level.
+        parts = []
+        self._render_into(parts.append)
+        html = "".join(parts)
+        self._html = html
+        return html
 
-        # Rule 2: Raise ValueError if children is None
-        # Allow empty list self.children == []
-        if self.children is None:
-             raise ValueError("Invalid HTML: ParentNode requires children.")
+    def _render_into(self, write):
+        """
+        Writes the HTML of this node and its descendants fragment by fragment.
+
+        Args:
+            write (callable): Called with each str fragment, in order
+                              (e.g. list.append or a file's write).
+
+        Raises:
+            ValueError: If the node's tag is missing.
+            ValueError: If the node's children list is missing (None).
+        """
+        # Depth-first with an explicit stack instead of recursion, so deep
+        # trees cost no Python frames (and can't hit the recursion limit).
+        # The stack holds nodes still to render and the closing-tag strings
+        # to write once their children are done.
+        stack = [self]
+        pop, push = stack.pop, stack.append
+        while stack:
+            node = pop()
+            if type(node) is str:
+                write(node) # Closing tag of a finished ParentNode
+                continue
 
-        # Build the HTML string
-        # Start with opening tag and props
-        props_html = self.props_to_html() # Get attribute string or ""
-        html_content = f"<{self.tag}{props_html}>"
+            # A memoized subtree is written out as-is
+            html = node._html
+            if html is not None:
+                write(html)
+                continue
+            if not isinstance(node, ParentNode):
+                node._render_into(write) # Leaf (or other) node renders itself
+                continue
 
-        # Recursively call to_html on children and append
-        for child in self.children:
-            html_content += child.to_html()
+            # Rule 1: Raise ValueError if tag is missing
+            if not node.tag: # Checks for None or empty string
+                 raise ValueError("Invalid HTML: ParentNode requires a tag.")
 
-        # Add closing tag
-        html_content += f"</{self.tag}>"
+            # Rule 2: Raise ValueError if children is None
+            # Allow empty list node.children == []
+            if node.children is None:
+                 raise ValueError("Invalid HTML: ParentNode requires children.")
 
-        return html_content
+            # Opening tag with precomputed attribute string (or "")
+            write(f"<{node.tag}{node.props_to_html()}>")
+            # Closing tag goes under the children, which are pushed in
+            # reverse so the first child is rendered first
+            push(f"</{node.tag}>")
+            stack.extend(reversed(node.children))
 
     def __repr__(self):
         # Optional: Provide a specific repr for ParentNode
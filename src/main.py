@@ -1,7 +1,30 @@
 # src/main.py
+import hashlib
 import os
+import re
+import shutil
 import sys
-from block_markdown import markdown_to_html_node, extract_title
+from functools import lru_cache
+from block_markdown import render_markdown_to_html_and_title
+
+# Sites with more pages than this are generated in a process pool, given
+# more than one CPU (below it, pool start-up costs more than it saves).
+_PARALLEL_PAGE_THRESHOLD = 200
+
+# Static trees with more files than this are copied by a thread pool, given
+# more than one CPU (small trees copy faster serially)
+_PARALLEL_COPY_THRESHOLD = 500
+
+# "{{ Title }}" / "{{ Content }}" in template.html
+_TEMPLATE_PLACEHOLDER_RE = re.compile(r"\{\{ (Title|Content) \}\}")
+
+# Rendered pages are cached across builds under PAGE_CACHE_DIR, keyed by a
+# hash of everything the output depends on (see page_cache_key), including
+# the generator's own source, so code changes invalidate the cache. Bump
+# PAGE_CACHE_VERSION only if the cache file format itself changes.
+PAGE_CACHE_DIR = os.path.join(".cache", "pages")
+PAGE_CACHE_VERSION = "1"
+PAGE_CACHE_MAX_ENTRIES = 16 ** 4 # Oldest entries (by mtime) are evicted past this
 
 # --- Custom Recursive Removal ---
 def remove_directory_recursive(dir_path):
@@ -13,140 +36,412 @@ def remove_directory_recursive(dir_path):
         print(f"  Error: '{dir_path}' is not a directory.")
         return
 
-    # print(f"  Removing contents of directory: {dir_path}")
     try:
-        items = os.listdir(dir_path)
-        for item in items:
-            item_path = os.path.join(dir_path, item)
-            if os.path.isfile(item_path):
-                # print(f"    Removing file: {item_path}")
-                os.remove(item_path)
-            elif os.path.isdir(item_path):
-                remove_directory_recursive(item_path) # Recursive call
-
-        # print(f"  Removing empty directory: {dir_path}")
-        os.rmdir(dir_path)
+        # Explicit stack instead of recursion (shutil.rmtree recurses once
+        # per level), so depth costs no Python frames. Files go as they are
+        # found; directories are recorded parent-first and removed in
+        # reverse, i.e. children before their parents.
+        dirs = []
+        stack = [dir_path]
+        while stack:
+            current = stack.pop()
+            dirs.append(current)
+            # scandir reuses the file type from the directory listing,
+            # so no extra stat() per entry
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        os.remove(entry.path)
+        for current in reversed(dirs):
+            os.rmdir(current)
     except OSError as e:
         print(f"  Error removing directory {dir_path}: {e}")
 
 
-# --- Manual File Copy and Recursive Directory Copy ---
-def copy_file_manual(src_file_path, dest_file_path):
-    """Manually copies a single file using read/write."""
+# --- Recursive Directory Copy ---
+def copy_directory_recursive(src_path, dest_path):
+    """
+    Recursively copies contents from src_path to dest_path,
+    merging into dest_path if it already exists.
+    """
+    if not os.path.exists(src_path):
+        raise ValueError(f"Source directory not found: {src_path}")
+    if not os.path.isdir(src_path):
+         raise ValueError(f"Source path must be a directory: {src_path}")
+
+    # Explicit stack of (source, destination) directory pairs instead of
+    # recursion (shutil.copytree recurses once per level). The walk only
+    # creates directories and lists the files; the copies happen after.
+    copies = []
+    join = os.path.join # Bound once for the per-entry calls below
+    stack = [(src_path, dest_path)]
+    while stack:
+        src_dir, dest_dir = stack.pop()
+        # makedirs doesn't error if the directory already exists
+        os.makedirs(dest_dir, exist_ok=True)
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                full_dest_path = join(dest_dir, entry.name)
+                # Symlinks are followed, as os.path.isfile/isdir did; only
+                # a symlink costs a stat(), other entries use the cached type
+                if entry.is_file():
+                    copies.append((entry.path, full_dest_path))
+                elif entry.is_dir():
+                    stack.append((entry.path, full_dest_path))
+
+    if len(copies) > _PARALLEL_COPY_THRESHOLD and (os.cpu_count() or 1) > 1:
+        # Copies are I/O-bound and copyfile releases the GIL, so threads
+        # keep several in flight and overlap their syscall latency. The
+        # default pool size, min(32, cpu_count + 4), suits I/O-bound work.
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor() as executor:
+            for _ in executor.map(_copy_file, copies):
+                pass
+    else:
+        for pair in copies:
+            _copy_file(pair)
+
+
+def _copy_file(pair):
+    """
+    Copies one (source, destination) file's contents (not its metadata),
+    reporting any error. copyfile uses the kernel's fast paths (sendfile on
+    Linux, fcopyfile on macOS) where available.
+    """
+    src_file_path, dest_file_path = pair
     # print(f"    Copying: {src_file_path} -> {dest_file_path}")
     try:
-        with open(src_file_path, 'rb') as src_file, open(dest_file_path, 'wb') as dest_file:
-            while True:
-                chunk = src_file.read(4096)
-                if not chunk:
-                    break
-                dest_file.write(chunk)
+        shutil.copyfile(src_file_path, dest_file_path)
     except OSError as e:
         print(f"    Error copying file {src_file_path} to {dest_file_path}: {e}")
 
 
-def copy_directory_recursive(src_path, dest_path):
+def read_text_file(path):
     """
-    Recursively copies contents from src_path to dest_path
-    using only the 'os' module and manual file I/O.
+    Reads a UTF-8 text file with one binary read and one decode.
+
+    Text mode would decode and translate newlines buffer by buffer; here
+    newlines are normalized to '\\n' (as text mode does) only if the file
+    contains a '\\r' at all.
     """
-    if not os.path.exists(src_path):
-        raise ValueError(f"Source directory not found: {src_path}")
-    if not os.path.isdir(src_path):
-         raise ValueError(f"Source path must be a directory: {src_path}")
+    with open(path, 'rb') as f:
+        text = f.read().decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
-    # Use makedirs which can create intermediate directories if needed
-    # and doesn't error if the directory already exists.
-    os.makedirs(dest_path, exist_ok=True)
-    # print(f"Ensured destination directory exists: {dest_path}")
 
-    items = os.listdir(src_path)
-    for item in items:
-        full_src_path = os.path.join(src_path, item)
-        full_dest_path = os.path.join(dest_path, item)
+def read_template(template_path):
+    """
+    Reads the page template. Done once per build; every page is rendered
+    from the returned string.
+
+    Raises:
+        FileNotFoundError: If the template does not exist.
+        Exception: If the template cannot be read.
+    """
+    try:
+        return read_text_file(template_path)
+    except FileNotFoundError: raise FileNotFoundError(f"Template file not found: {template_path}")
+    except Exception as e: raise Exception(f"Error reading template file {template_path}: {e}")
 
-        if os.path.isfile(full_src_path):
-            copy_file_manual(full_src_path, full_dest_path)
-        elif os.path.isdir(full_src_path):
-            copy_directory_recursive(full_src_path, full_dest_path) # Recursive call
 
-def generate_page(from_path, template_path, dest_path, basepath="/"): # Add basepath argument
+def generate_page(from_path, template_content, dest_path, basepath="/"): # Add basepath argument
     """
-    Generates an HTML page from a Markdown file using a template.
+    Generates an HTML page from a Markdown file using a template
+    (the template's contents, as returned by read_template).
     Replaces root-relative paths with the provided basepath.
+    Pages whose inputs are unchanged since an earlier build are copied from
+    the page cache (PAGE_CACHE_DIR) instead of being re-rendered.
+
+    The caller must ensure dirname(dest_path) exists (collect_page_tasks
+    creates every destination directory up front).
     """
-    print(f"Generating page from {from_path} to {dest_path} using {template_path} (basepath: {basepath})")
+    print(f"Generating page from {from_path} to {dest_path} (basepath: {basepath})")
 
-    # ... (Read markdown_content and template_content as before) ...
     try:
-        with open(from_path, 'r', encoding='utf-8') as f: markdown_content = f.read()
+        markdown_content = read_text_file(from_path)
     except FileNotFoundError: raise FileNotFoundError(f"Markdown source file not found: {from_path}")
     except Exception as e: raise Exception(f"Error reading Markdown file {from_path}: {e}")
+
+    # Unchanged page from an earlier build: reuse its HTML without parsing
+    cache_path = os.path.join(
+        PAGE_CACHE_DIR,
+        page_cache_key(markdown_content, template_content, basepath) + ".html")
+    if os.path.isfile(cache_path):
+        try:
+            shutil.copyfile(cache_path, dest_path)
+            os.utime(cache_path) # Mark as recently used for eviction
+            return
+        except OSError as e:
+            # Fall through and render the page as if the cache were cold
+            print(f"  Warning: could not use cached page {cache_path}: {e}")
+
     try:
-        with open(template_path, 'r', encoding='utf-8') as f: template_content = f.read()
-    except FileNotFoundError: raise FileNotFoundError(f"Template file not found: {template_path}")
-    except Exception as e: raise Exception(f"Error reading template file {template_path}: {e}")
+        html_content, title = render_markdown_to_html_and_title(markdown_content)
+    except ValueError as e: raise ValueError(f"Could not render {from_path}: {e}") # Bad syntax or no H1
+
+    # Fill the pre-split template, rather than running a replace pass per
+    # placeholder and per path prefix over the whole page
+    segments = split_template(template_content, basepath)
+    values = {"Title": title, "Content": html_content}
+    pieces = list(segments)
+    for i in range(1, len(pieces), 2): # Odd positions hold placeholder names
+        # Only the per-page values need encoding; the literals already are
+        pieces[i] = rewrite_root_paths(values[pieces[i]], basepath).encode('utf-8')
 
-    html_node = markdown_to_html_node(markdown_content)
-    html_content = html_node.to_html()
+    # Write the new HTML to dest_path piece by piece, never holding the
+    # whole page as one string
     try:
-        title = extract_title(markdown_content)
-    except ValueError as e: raise ValueError(f"Could not extract title from {from_path}: {e}")
+        with open(dest_path, 'wb') as f: f.writelines(pieces)
+    except Exception as e: raise Exception(f"Error writing HTML file to {dest_path}: {e}")
+
+    store_cached_page(cache_path, pieces)
+
 
-    # Replace placeholders
-    final_html = template_content.replace("{{ Title }}", title)
-    final_html = final_html.replace("{{ Content }}", html_content)
+@lru_cache(maxsize=8)
+def split_template(template_content, basepath="/"):
+    """
+    Splits the template around its placeholders, once per build.
+
+    Args:
+        template_content (str): The HTML template.
+        basepath (str): The basepath, applied to the template's own
+                        root-relative paths here (see rewrite_root_paths).
 
-    # --- Replace root-relative paths with basepath ---
+    Returns:
+        tuple[bytes | str, ...]: UTF-8 encoded literal text at even positions,
+                                 placeholder names ("Title" or "Content", as
+                                 str) at odd positions.
+    """
+    # re.split with a capturing group interleaves literals and names
+    segments = _TEMPLATE_PLACEHOLDER_RE.split(template_content)
+    for i in range(0, len(segments), 2):
+        # Encoded here once, rather than with every page written
+        segments[i] = rewrite_root_paths(segments[i], basepath).encode('utf-8')
+    return tuple(segments)
+
+
+def rewrite_root_paths(html, basepath):
+    """
+    Replaces root-relative paths (href="/..." and src="/...") with basepath.
+    """
+    if basepath == "/":
+        return html # Nothing to rewrite
     # Important: Only replace paths starting with "/" that are NOT part of absolute URLs
     # This simple replace works for href="/..." and src="/..."
-    final_html = final_html.replace('href="/', f'href="{basepath}')
-    final_html = final_html.replace('src="/', f'src="{basepath}')
-    # -------------------------------------------------
+    html = html.replace('href="/', f'href="{basepath}')
+    return html.replace('src="/', f'src="{basepath}')
+
 
-    # Write the new HTML to dest_path
-    dest_dir = os.path.dirname(dest_path)
-    if dest_dir: os.makedirs(dest_dir, exist_ok=True)
+@lru_cache(maxsize=None)
+def generator_fingerprint():
+    """
+    Returns a digest of the generator's own source files.
+
+    Every non-test .py file next to this module (renderer, inline parser,
+    template handling, ...) is hashed, so editing any of them changes
+    every page cache key. Computed once per process.
+
+    Returns:
+        str: A 32-character hex digest.
+    """
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    h = hashlib.blake2b(digest_size=16)
+    for name in sorted(os.listdir(src_dir)):
+        if not name.endswith(".py") or name.startswith("test_"):
+            continue
+        # Name and contents, NUL-separated, for each source file
+        h.update(name.encode('utf-8'))
+        h.update(b'\0')
+        with open(os.path.join(src_dir, name), 'rb') as f:
+            h.update(f.read())
+        h.update(b'\0')
+    return h.hexdigest()
+
+def page_cache_key(markdown_content, template_content, basepath):
+    """
+    Returns the page cache key for a page's inputs.
+
+    Args:
+        markdown_content (str): The page's Markdown source.
+        template_content (str): The HTML template.
+        basepath (str): The basepath substituted into root-relative links.
+
+    Returns:
+        str: A 32-character hex digest.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    # NUL separators keep e.g. ("ab", "c") and ("a", "bc") from colliding
+    for part in (PAGE_CACHE_VERSION, generator_fingerprint(), basepath, template_content):
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    h.update(markdown_content.encode('utf-8'))
+    return h.hexdigest()
+
+
+def store_cached_page(cache_path, pieces):
+    """
+    Writes a rendered page (an iterable of UTF-8 bytes pieces) into the page cache.
+    The cache is only an accelerator, so failures are reported, not raised.
+    """
     try:
-        with open(dest_path, 'w', encoding='utf-8') as f: f.write(final_html)
-    except Exception as e: raise Exception(f"Error writing HTML file to {dest_path}: {e}")
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write under a per-process name and rename into place, so pool
+        # workers rendering identical pages never see a half-written entry
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f: f.writelines(pieces)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"  Warning: could not cache page at {cache_path}: {e}")
+
+
+def prune_page_cache(cache_dir=PAGE_CACHE_DIR, max_entries=PAGE_CACHE_MAX_ENTRIES):
+    """
+    Evicts the least recently used pages once the cache holds more than
+    max_entries. Hits refresh an entry's mtime, so mtime order is LRU order.
+    """
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(entry.stat().st_mtime, entry.path) for entry in it
+                       if entry.name.endswith(".html")]
+    except FileNotFoundError:
+        return # No cache yet
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass # Already gone (e.g. a concurrent build pruned it)
+
+def collect_page_tasks(dir_path_content, dest_dir_path, tasks, template_mtime=None):
+    """
+    Collects (markdown_path, html_path) pairs for every .md file under
+    dir_path_content, creating the matching destination directories.
 
-def generate_pages_recursive(dir_path_content, template_path, dest_dir_path, basepath="/"): # Add basepath argument
+    Args:
+        dir_path_content (str): Source content directory.
+        dest_dir_path (str): Destination directory mirroring the source.
+        tasks (list[tuple[str, str]]): List the pairs are appended to.
+        template_mtime (float, optional): For incremental builds, the
+            template's mtime. Pages whose .html is at least as new as both
+            their .md and the template are then left out. Defaults to None
+            (collect every page).
+
+    Returns:
+        int: The number of up-to-date pages left out.
+    """
+    skipped = 0
+    # Bound once: these are called for every directory / file below
+    join, normpath, splitext, append = os.path.join, os.path.normpath, os.path.splitext, tasks.append
+    # One flat os.walk (scandir underneath) rather than a call per directory;
+    # each root's path below dir_path_content is mirrored under dest_dir_path.
+    # Symlinked directories are descended into, as os.path.isdir did.
+    prefix_len = len(dir_path_content)
+    for root, _dirs, files in os.walk(dir_path_content, followlinks=True):
+        dest_dir = normpath(join(dest_dir_path, root[prefix_len:].lstrip(os.sep)))
+        os.makedirs(dest_dir, exist_ok=True)
+        for item in files:
+            if item.lower().endswith(".md"):
+                base_name, _ = splitext(item)
+                dest_html_path = join(dest_dir, f"{base_name}.html")
+                src_path = join(root, item)
+                if template_mtime is not None and _is_up_to_date(
+                        src_path, dest_html_path, template_mtime):
+                    skipped += 1
+                    continue
+                append((src_path, dest_html_path))
+    return skipped
+
+
+def _is_up_to_date(src_path, dest_path, template_mtime):
+    """True if dest_path exists and is no older than src_path and the template."""
+    try:
+        dest_mtime = os.stat(dest_path).st_mtime
+    except FileNotFoundError:
+        return False # Never generated
+    return dest_mtime >= max(os.stat(src_path).st_mtime, template_mtime)
+
+
+# --- Page worker (runs in a pool process, or inline for small sites) ---
+# Arguments shared by every page, set once per worker by _init_page_worker
+# instead of being pickled with each task.
+_worker_template_content = None
+_worker_basepath = "/"
+
+def _init_page_worker(template_content, basepath):
+    """Stores the per-build page arguments in this (worker) process."""
+    global _worker_template_content, _worker_basepath
+    _worker_template_content = template_content
+    _worker_basepath = basepath
+
+def _generate_page_task(task):
+    """Generates one (markdown_path, html_path) page, reporting any error."""
+    src_path, dest_html_path = task
+    try:
+        generate_page(src_path, _worker_template_content, dest_html_path, _worker_basepath)
+    except Exception as e:
+        print(f"Error generating page for {src_path}: {e}")
+
+
+def generate_pages_recursive(dir_path_content, template_content, dest_dir_path, basepath="/", # Add basepath argument
+                             template_mtime=None):
     """
     Recursively generates HTML pages from Markdown files in a source directory
-    to a destination directory using a template, applying the basepath.
+    to a destination directory using a template (its contents, see
+    read_template), applying the basepath.
+
+    Pages are independent, so after a cheap walk collecting them, sites with
+    more than _PARALLEL_PAGE_THRESHOLD pages are rendered in a process pool
+    when more than one CPU is available.
+
+    If template_mtime is given, pages already newer than their source and
+    the template are skipped (see collect_page_tasks).
     """
     if not os.path.isdir(dir_path_content):
         # print(f"Warning: Content path '{dir_path_content}' is not a directory. Skipping.")
         return
 
-    os.makedirs(dest_dir_path, exist_ok=True)
+    tasks = []
+    skipped = collect_page_tasks(dir_path_content, dest_dir_path, tasks, template_mtime)
+    if skipped:
+        print(f"  Skipped {skipped} up-to-date page(s).")
 
-    items = os.listdir(dir_path_content)
-    for item in items:
-        full_src_path = os.path.join(dir_path_content, item)
-        full_dest_path = os.path.join(dest_dir_path, item)
+    workers = os.cpu_count() or 1
+    if len(tasks) > _PARALLEL_PAGE_THRESHOLD and workers > 1:
+        # Imported only here: most builds stay serial and skip its import cost
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_page_worker,
+                                 initargs=(template_content, basepath)) as executor:
+            # Consume the iterator so every task has finished on exit
+            for _ in executor.map(_generate_page_task, tasks):
+                pass
+    else:
+        # Too few pages (or CPUs) to pay for pool start-up
+        _init_page_worker(template_content, basepath)
+        for task in tasks:
+            _generate_page_task(task)
 
-        if os.path.isfile(full_src_path):
-            if item.lower().endswith(".md"):
-                base_name, _ = os.path.splitext(item)
-                dest_html_path = os.path.join(dest_dir_path, f"{base_name}.html")
-                try:
-                    # Pass basepath down to generate_page
-                    generate_page(full_src_path, template_path, dest_html_path, basepath)
-                except Exception as e:
-                    print(f"Error generating page for {full_src_path}: {e}")
-        elif os.path.isdir(full_src_path):
-            # Pass basepath down recursively
-            generate_pages_recursive(full_src_path, template_path, full_dest_path, basepath)
+    prune_page_cache()
 
 
 # --- Main Function ---
 def main():
     # --- Determine Base Path from CLI argument ---
+    # --incremental keeps the existing output and only regenerates pages
+    # whose .md (or the template) changed since their .html was written.
+    # Use a full build after changing the basepath or the generator itself.
+    args = [arg for arg in sys.argv[1:] if arg != "--incremental"]
+    incremental = len(args) < len(sys.argv) - 1
+
     basepath = "/" # Default base path
-    if len(sys.argv) > 1:
-        basepath = sys.argv[1]
+    if args:
+        basepath = args[0]
         # Ensure basepath starts and ends with / unless it's just "/"
         if not basepath.startswith("/"):
              basepath = "/" + basepath
@@ -164,15 +459,19 @@ def main():
     output_dir = "docs"
     # -----------------------------------------
 
-    # Clean output directory
-    print(f"\nCleaning destination directory: {output_dir}...")
-    remove_directory_recursive(output_dir) # Use the updated variable
-    try:
-        os.mkdir(output_dir) # Use the updated variable
-        print(f"  Created empty directory: {output_dir}")
-    except OSError as e:
-        print(f"  Error creating directory {output_dir}: {e}")
-        return
+    # Clean output directory (incremental builds update it in place)
+    if incremental:
+        print(f"\nIncremental build: keeping destination directory {output_dir}")
+        os.makedirs(output_dir, exist_ok=True)
+    else:
+        print(f"\nCleaning destination directory: {output_dir}...")
+        remove_directory_recursive(output_dir) # Use the updated variable
+        try:
+            os.mkdir(output_dir) # Use the updated variable
+            print(f"  Created empty directory: {output_dir}")
+        except OSError as e:
+            print(f"  Error creating directory {output_dir}: {e}")
+            return
 
     # Copy static files
     print(f"\nCopying static files from {static_dir} to {output_dir}...")
@@ -185,12 +484,16 @@ def main():
     # Generate content pages recursively
     print(f"\nGenerating content pages from {content_dir}...")
     try:
+        # Read the template once for all pages
+        template_content = read_template(template_path)
+        template_mtime = os.stat(template_path).st_mtime if incremental else None
         # Pass the determined basepath to the recursive function
         generate_pages_recursive(
             content_dir,
-            template_path,
+            template_content,
             output_dir, # Use the updated variable
-            basepath    # Pass the basepath
+            basepath,   # Pass the basepath
+            template_mtime
         )
         print("  Finished generating content pages.")
     except Exception as e:
@@ -96,94 +96,112 @@ This is the same paragraph on a new line
         self.assertListEqual([], blocks)
 
 
+    # Test case 9: Blank lines containing whitespace, and CRLF line endings
+    def test_markdown_to_blocks_whitespace_and_crlf_separators(self):
+        """Tests that whitespace-only lines and CRLF blank lines separate blocks."""
+        md = "Block 1\n   \nBlock 2\r\n\r\nBlock 3"
+        blocks = markdown_to_blocks(md)
+        expected = [
+            "Block 1",
+            "Block 2",
+            "Block 3",
+        ]
+        self.assertListEqual(expected, blocks)
+
+
+    def assertBlockTypes(self, cases):
+        """Checks block_to_block_type against a table of (block, expected) cases."""
+        for block, expected in cases:
+            with self.subTest(block=block):
+                self.assertEqual(block_to_block_type(block), expected)
+
     def test_block_type_heading(self):
         """Tests identifying heading blocks."""
-        self.assertEqual(block_to_block_type("# Heading 1"), BlockType.HEADING)
-        self.assertEqual(block_to_block_type("## Heading 2"), BlockType.HEADING)
-        self.assertEqual(block_to_block_type("### Heading 3"), BlockType.HEADING)
-        self.assertEqual(block_to_block_type("#### Heading 4"), BlockType.HEADING)
-        self.assertEqual(block_to_block_type("##### Heading 5"), BlockType.HEADING)
-        self.assertEqual(block_to_block_type("###### Heading 6"), BlockType.HEADING)
-        # Invalid headings (no space or too many #) should be paragraphs
-        self.assertEqual(block_to_block_type("#NoSpace"), BlockType.PARAGRAPH)
-        self.assertEqual(block_to_block_type("####### Too Many Hashes"), BlockType.PARAGRAPH)
-        self.assertEqual(block_to_block_type("Not a heading # in middle"), BlockType.PARAGRAPH)
+        self.assertBlockTypes([
+            ("# Heading 1", BlockType.HEADING),
+            ("## Heading 2", BlockType.HEADING),
+            ("### Heading 3", BlockType.HEADING),
+            ("#### Heading 4", BlockType.HEADING),
+            ("##### Heading 5", BlockType.HEADING),
+            ("###### Heading 6", BlockType.HEADING),
+            # Invalid headings (no space or too many #) should be paragraphs
+            ("#NoSpace", BlockType.PARAGRAPH),
+            ("####### Too Many Hashes", BlockType.PARAGRAPH),
+            ("Not a heading # in middle", BlockType.PARAGRAPH),
+        ])
 
 
     def test_block_type_code(self):
         """Tests identifying code blocks."""
-        block = "```\nprint('hello')\n```"
-        self.assertEqual(block_to_block_type(block), BlockType.CODE)
-        block_single_line = "```inline code```" # Assuming this is valid per rules
-        self.assertEqual(block_to_block_type(block_single_line), BlockType.CODE)
-        # Invalid code blocks
-        block_no_end = "```\ncode"
-        self.assertEqual(block_to_block_type(block_no_end), BlockType.PARAGRAPH)
-        block_no_start = "code\n```"
-        self.assertEqual(block_to_block_type(block_no_start), BlockType.PARAGRAPH)
-        block_just_ticks = "```" # Should not be code
-        self.assertEqual(block_to_block_type(block_just_ticks), BlockType.PARAGRAPH)
+        self.assertBlockTypes([
+            ("```\nprint('hello')\n```", BlockType.CODE),
+            ("```inline code```", BlockType.CODE), # Assuming this is valid per rules
+            # Invalid code blocks
+            ("```\ncode", BlockType.PARAGRAPH), # No end
+            ("code\n```", BlockType.PARAGRAPH), # No start
+            ("```", BlockType.PARAGRAPH), # Just ticks, should not be code
+        ])
 
 
     def test_block_type_quote(self):
         """Tests identifying quote blocks."""
-        block = "> This is a quote\n> Spanning multiple lines."
-        self.assertEqual(block_to_block_type(block), BlockType.QUOTE)
-        block_single_line = "> Just one line."
-        self.assertEqual(block_to_block_type(block_single_line), BlockType.QUOTE)
-        # Invalid quote block (one line doesn't start with >)
-        block_invalid = "> First line quote\nSecond line not quote."
-        self.assertEqual(block_to_block_type(block_invalid), BlockType.PARAGRAPH)
-        block_empty_line_not_quote = "> Quote\n\n> After empty line" # Empty line breaks quote rule
-        self.assertEqual(block_to_block_type(block_empty_line_not_quote), BlockType.PARAGRAPH)
+        self.assertBlockTypes([
+            ("> This is a quote\n> Spanning multiple lines.", BlockType.QUOTE),
+            ("> Just one line.", BlockType.QUOTE),
+            # Invalid quote block (one line doesn't start with >)
+            ("> First line quote\nSecond line not quote.", BlockType.PARAGRAPH),
+            ("> Quote\n\n> After empty line", BlockType.PARAGRAPH), # Empty line breaks quote rule
+        ])
 
 
     def test_block_type_unordered_list(self):
         """Tests identifying unordered list blocks."""
-        block_dash = "- Item 1\n- Item 2"
-        self.assertEqual(block_to_block_type(block_dash), BlockType.UNORDERED_LIST)
-        block_star = "* Item A\n* Item B"
-        self.assertEqual(block_to_block_type(block_star), BlockType.UNORDERED_LIST)
-        block_mixed = "* Item 1\n- Item 2" # Mixed markers are often allowed, let's test if our rule covers this
-        self.assertEqual(block_to_block_type(block_mixed), BlockType.UNORDERED_LIST) # Yes, it should
-        block_single_item = "- Only one"
-        self.assertEqual(block_to_block_type(block_single_item), BlockType.UNORDERED_LIST)
-        # Invalid unordered list
-        block_invalid_marker = "- Item 1\n+ Item 2" # '+' is not a valid marker here
-        self.assertEqual(block_to_block_type(block_invalid_marker), BlockType.PARAGRAPH)
-        block_no_space = "-Item without space"
-        self.assertEqual(block_to_block_type(block_no_space), BlockType.PARAGRAPH)
-        block_mixed_paragraph = "- Item 1\nThis is a paragraph line"
-        self.assertEqual(block_to_block_type(block_mixed_paragraph), BlockType.PARAGRAPH)
+        self.assertBlockTypes([
+            ("- Item 1\n- Item 2", BlockType.UNORDERED_LIST),
+            ("* Item A\n* Item B", BlockType.UNORDERED_LIST),
+            ("* Item 1\n- Item 2", BlockType.UNORDERED_LIST), # Mixed markers are allowed
+            ("- Only one", BlockType.UNORDERED_LIST),
+            # Invalid unordered list
+            ("- Item 1\n+ Item 2", BlockType.PARAGRAPH), # '+' is not a valid marker here
+            ("-Item without space", BlockType.PARAGRAPH),
+            ("- Item 1\nThis is a paragraph line", BlockType.PARAGRAPH),
+        ])
 
 
     def test_block_type_ordered_list(self):
         """Tests identifying ordered list blocks."""
-        block_valid = "1. First\n2. Second\n3. Third"
-        self.assertEqual(block_to_block_type(block_valid), BlockType.ORDERED_LIST)
-        block_single_item = "1. Only one"
-        self.assertEqual(block_to_block_type(block_single_item), BlockType.ORDERED_LIST)
-        # Invalid ordered lists
-        block_wrong_start = "2. Starts at two"
-        self.assertEqual(block_to_block_type(block_wrong_start), BlockType.PARAGRAPH)
-        block_wrong_sequence = "1. First\n3. Skipped two"
-        self.assertEqual(block_to_block_type(block_wrong_sequence), BlockType.PARAGRAPH)
-        block_no_space = "1.No space"
-        self.assertEqual(block_to_block_type(block_no_space), BlockType.PARAGRAPH)
-        block_wrong_format = "1) Wrong format"
-        self.assertEqual(block_to_block_type(block_wrong_format), BlockType.PARAGRAPH)
-        block_mixed_paragraph = "1. Item 1\nThis is a paragraph line"
-        self.assertEqual(block_to_block_type(block_mixed_paragraph), BlockType.PARAGRAPH)
+        self.assertBlockTypes([
+            ("1. First\n2. Second\n3. Third", BlockType.ORDERED_LIST),
+            ("1. Only one", BlockType.ORDERED_LIST),
+            # Invalid ordered lists
+            ("2. Starts at two", BlockType.PARAGRAPH),
+            ("1. First\n3. Skipped two", BlockType.PARAGRAPH),
+            ("1.No space", BlockType.PARAGRAPH),
+            ("1) Wrong format", BlockType.PARAGRAPH),
+            ("1. Item 1\nThis is a paragraph line", BlockType.PARAGRAPH),
+        ])
 
 
     def test_block_type_paragraph(self):
         """Tests identifying paragraph blocks (default)."""
-        block_simple = "This is just a plain paragraph."
-        self.assertEqual(block_to_block_type(block_simple), BlockType.PARAGRAPH)
-        block_multiline = "Paragraphs can span\nmultiple lines\nwithout special markers."
-        self.assertEqual(block_to_block_type(block_multiline), BlockType.PARAGRAPH)
-        block_with_symbols = "Text containing > * - 1. symbols but not following rules."
-        self.assertEqual(block_to_block_type(block_with_symbols), BlockType.PARAGRAPH)
+        self.assertBlockTypes([
+            ("This is just a plain paragraph.", BlockType.PARAGRAPH),
+            ("Paragraphs can span\nmultiple lines\nwithout special markers.", BlockType.PARAGRAPH),
+            ("Text containing > * - 1. symbols but not following rules.", BlockType.PARAGRAPH),
+        ])
+
+
+    def test_classify_block_payload(self):
+        """Tests the payload classify_block returns alongside the type."""
+        block_type, lines = classify_block("Line one\nLine two")
+        self.assertEqual(block_type, BlockType.PARAGRAPH)
+        self.assertListEqual(lines, ["Line one", "Line two"])
+        block_type, content = classify_block("```\ncode\n```")
+        self.assertEqual(block_type, BlockType.CODE)
+        self.assertEqual(content, "code")
+        block_type, block = classify_block("- Item 1\n- Item 2")
+        self.assertEqual(block_type, BlockType.UNORDERED_LIST)
+        self.assertEqual(block, "- Item 1\n- Item 2")
 
 
     def test_md_to_html_paragraphs(self):
@@ -253,6 +271,13 @@ Another paragraph.
         expected_html_simple = "<div><blockquote>This is a quote.\nIt has <b>bold</b> text.</blockquote><p>Another paragraph.</p></div>"
         self.assertEqual(html, expected_html_simple)
 
+    def test_md_to_html_nested_blockquote_markers(self):
+        """Tests that every leading '>'/space is stripped, as in '> > x'."""
+        md = "> > Nested quote\n>> Tight markers\n>\n> Plain"
+        expected_html = "<div><blockquote>Nested quote\nTight markers\n\nPlain</blockquote></div>"
+        self.assertEqual(markdown_to_html_node(md).to_html(), expected_html)
+        self.assertEqual(render_markdown_to_html(md), expected_html)
+
 
     def test_md_to_html_codeblock(self):
         """Tests conversion of code blocks (no inline parsing)."""
@@ -267,6 +292,45 @@ def function(x):
 
 
 
+    def test_md_to_html_codeblock_content(self):
+        """Tests that code block content is emitted verbatim inside <pre><code>."""
+        md = "```\ndef f(x):\n    return x * _y_\n```"
+        html = markdown_to_html_node(md).to_html()
+        expected_html = "<div><pre><code>def f(x):\n    return x * _y_</code></pre></div>"
+        self.assertEqual(html, expected_html)
+
+    def test_render_markdown_to_html_matches_node_tree(self):
+        """Tests that direct rendering matches the HTMLNode tree output."""
+        md = """
+# Title with **bold**
+
+A paragraph with _italic_, `code`, a [link](https://boot.dev)
+and an ![image](/img.png) – plus non-ASCII ✓.
+
+> Quoted **text**
+>
+> -- Someone
+
+- Item _one_
+* Item two
+
+1. First
+2. Second
+
+```
+raw **not bold**
+```
+"""
+        self.assertEqual(render_markdown_to_html(md), markdown_to_html_node(md).to_html())
+
+    def test_md_to_html_returns_fresh_leaves(self):
+        """Tests that mutating one returned tree does not leak into later conversions."""
+        markdown_to_html_node("hello **world**").children[0].children[1].value = "X"
+        self.assertEqual(markdown_to_html_node("other **world**").to_html(),
+                         "<div><p>other <b>world</b></p></div>")
+        self.assertEqual(render_markdown_to_html("other **world**"),
+                         "<div><p>other <b>world</b></p></div>")
+
     def test_extract_title_valid(self):
         """Tests extracting a valid H1 title."""
         md = """
@@ -308,12 +372,37 @@ More text.
         md = "# Title with spaces   \n"
         self.assertEqual(extract_title(md), "Title with spaces")
 
+    def test_extract_title_skips_empty_and_tab_markers(self):
+        """Tests that '#' lines without '# ' plus text are not titles."""
+        md = "#   \n#\tTabbed\n \t#  Real Title \r\nText"
+        self.assertEqual(extract_title(md), "Real Title")
+
     def test_extract_title_empty_input(self):
         """Tests raising error on empty input."""
         md = ""
         with self.assertRaisesRegex(ValueError, "No H1 heading found"):
             extract_title(md)
 
+    def test_render_markdown_to_html_and_title(self):
+        """Tests the combined render matches the separate calls."""
+        md = """
+Some preamble text.
+
+## Subheading
+
+   # The Title  
+
+More **text**.
+"""
+        self.assertEqual(render_markdown_to_html_and_title(md),
+                         (render_markdown_to_html(md), extract_title(md)))
+        self.assertEqual(render_markdown_to_html_and_title(md)[1], "The Title")
+
+    def test_render_markdown_to_html_and_title_no_h1(self):
+        """Tests the combined render raises like extract_title."""
+        with self.assertRaisesRegex(ValueError, "No H1 heading found"):
+            render_markdown_to_html_and_title("## Subheading\n\nText")
+
 # Standard boilerplate
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
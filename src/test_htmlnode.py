@@ -1,7 +1,7 @@
 import unittest
 
 # Import the class we want to test
-from htmlnode import HTMLNode
+from htmlnode import HTMLNode, LeafNode, ParentNode
 
 class TestHTMLNode(unittest.TestCase):
 
@@ -64,6 +64,26 @@ class TestHTMLNode(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             node.to_html()
 
+    # Test case 8: Nodes are slotted (no per-instance __dict__)
+    def test_nodes_have_no_instance_dict(self):
+        """Tests that node classes use __slots__ all the way down."""
+        for node in (HTMLNode("p"), LeafNode("x", "b"), ParentNode("div", [])):
+            with self.subTest(node_type=type(node).__name__):
+                self.assertFalse(hasattr(node, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    node.extra = 1
+
+    # Test case 9: The cached attribute string follows props reassignment
+    def test_props_to_html_after_props_assigned(self):
+        """Tests that assigning props refreshes props_to_html and to_html."""
+        node = LeafNode("Click", "a", {"href": "/old"})
+        self.assertEqual(node.to_html(), '<a href="/old">Click</a>')
+        node.props = {"href": "/new"}
+        self.assertEqual(node.props_to_html(), ' href="/new"')
+        self.assertEqual(node.to_html(), '<a href="/new">Click</a>')
+        node.props = None
+        self.assertEqual(node.to_html(), "<a>Click</a>")
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
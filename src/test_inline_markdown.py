@@ -18,6 +18,25 @@ class TestInlineMarkdown(unittest.TestCase):
         ]
         self.assertListEqual(new_nodes, expected)
 
+    def test_split_repeated_text_returns_fresh_lists(self):
+        """Tests repeated (memoized) splits still return independent lists."""
+        node = TextNode("Repeated `snippet` here", TextType.TEXT)
+        first = split_nodes_delimiter([node], "`", TextType.CODE)
+        second = split_nodes_delimiter([node], "`", TextType.CODE)
+        self.assertListEqual(first, second)
+        self.assertIsNot(first, second)
+        first.append(TextNode("extra", TextType.TEXT))
+        self.assertEqual(len(split_nodes_delimiter([node], "`", TextType.CODE)), 3)
+
+    def test_split_repeated_text_returns_fresh_nodes(self):
+        """Tests that mutating a split result does not change later splits."""
+        node = TextNode("Mutable `snippet` here", TextType.TEXT)
+        first = split_nodes_delimiter([node], "`", TextType.CODE)
+        first[1].text = "changed"
+        second = split_nodes_delimiter([node], "`", TextType.CODE)
+        self.assertIsNot(first[1], second[1])
+        self.assertEqual(second[1], TextNode("snippet", TextType.CODE))
+
     # Test case 2: Basic bold splitting
     def test_split_bold(self):
         """Tests basic splitting with the bold delimiter."""
@@ -134,6 +153,18 @@ class TestInlineMarkdown(unittest.TestCase):
         ]
         self.assertListEqual(new_nodes, expected)
 
+    def test_split_drops_empty_text_node(self):
+        """Tests that an empty TEXT node is dropped, like the image/link splitters do."""
+        node = TextNode("Some `code`", TextType.TEXT)
+        empty = TextNode("", TextType.TEXT)
+        new_nodes = split_nodes_delimiter([empty, node, empty], "`", TextType.CODE)
+        expected = [
+            TextNode("Some ", TextType.TEXT),
+            TextNode("code", TextType.CODE),
+        ]
+        self.assertListEqual(new_nodes, expected)
+        self.assertListEqual(split_nodes_image([empty]), split_nodes_delimiter([empty], "`", TextType.CODE))
+
     # Test case 11: Error on unmatched delimiter
     def test_split_unmatched_delimiter(self):
         """Tests that ValueError is raised for unmatched delimiters."""
@@ -156,6 +187,40 @@ class TestInlineMarkdown(unittest.TestCase):
          ]
          self.assertListEqual(new_nodes, expected)
 
+    def test_split_multiple_delimiter_types(self):
+        """Tests splitting on several delimiters in one pass."""
+        nodes = [
+            TextNode("A **bold** and _italic_ with `code`", TextType.TEXT),
+            TextNode("Already bold", TextType.BOLD),
+        ]
+        new_nodes = split_nodes_delimiters(
+            nodes,
+            [("**", TextType.BOLD), ("_", TextType.ITALIC), ("`", TextType.CODE)],
+        )
+        expected = [
+            TextNode("A ", TextType.TEXT),
+            TextNode("bold", TextType.BOLD),
+            TextNode(" and ", TextType.TEXT),
+            TextNode("italic", TextType.ITALIC),
+            TextNode(" with ", TextType.TEXT),
+            TextNode("code", TextType.CODE),
+            TextNode("Already bold", TextType.BOLD),
+        ]
+        self.assertListEqual(new_nodes, expected)
+
+    def test_split_default_delimiters(self):
+        """Tests the default delimiter set (bold, italic, code) in one pass."""
+        nodes = [TextNode("**b** _i_ `c_d`", TextType.TEXT)]
+        expected = [
+            TextNode("b", TextType.BOLD),
+            TextNode(" ", TextType.TEXT),
+            TextNode("i", TextType.ITALIC),
+            TextNode(" ", TextType.TEXT),
+            TextNode("c_d", TextType.CODE),
+        ]
+        self.assertListEqual(split_nodes_delimiters(nodes), expected)
+        self.assertListEqual(split_nodes_delimiters(nodes, INLINE_DELIMITERS), expected)
+
     def test_extract_images_single(self):
         """Tests extracting a single image."""
         text = "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png)"
@@ -234,6 +299,25 @@ class TestInlineMarkdown(unittest.TestCase):
              ("", "/url.org")
          ]
          self.assertListEqual(expected, matches)
+
+    def test_extract_unterminated_markup_is_linear(self):
+        """Tests many unclosed images/links finish fast (no backtracking blow-up)."""
+        # The negated character classes stop at the next bracket/paren, so each
+        # start position is rejected after a bounded scan.
+        text = "![alt](no close " * 20000 + "[anchor](also open " * 20000
+        self.assertListEqual([], extract_markdown_images(text))
+        self.assertListEqual([], extract_markdown_links(text))
+        # A real link at the very end is still found
+        self.assertListEqual([("x", "y")], extract_markdown_links(text + "[x](y)"))
+
+    def test_extract_repeated_text_returns_fresh_lists(self):
+        """Tests repeated (memoized) extractions still return independent lists."""
+        text = "![img](i.png) and [link](l.com)"
+        for extract in (extract_markdown_images, extract_markdown_links):
+            with self.subTest(extract=extract.__name__):
+                first = extract(text)
+                first.append(("extra", "x"))
+                self.assertEqual(1, len(extract(text)))
          
          
     def test_split_image_single(self):
@@ -400,7 +484,17 @@ class TestInlineMarkdown(unittest.TestCase):
             TextNode("Text with ![image](img.png) and ", TextType.TEXT),
             TextNode("link", TextType.LINK, "link.com"),
         ]
-        self.assertListEqual(expected, new_nodes)         
+        self.assertListEqual(expected, new_nodes)
+
+    def test_split_image_link_without_markers(self):
+        """Tests that text lacking '![' / '](' passes through, empty text dropped."""
+        node = TextNode("A [note] and a bang! (aside)", TextType.TEXT)
+        empty = TextNode("", TextType.TEXT)
+        for split in (split_nodes_image, split_nodes_link):
+            with self.subTest(split=split.__name__):
+                new_nodes = split([node, empty])
+                self.assertEqual(1, len(new_nodes))
+                self.assertIs(node, new_nodes[0])
          
     def test_text_to_textnodes_example(self):
         """Tests the main example provided in the assignment."""
@@ -498,7 +592,69 @@ class TestInlineMarkdown(unittest.TestCase):
             TextNode(" here.", TextType.TEXT),
         ]
         self.assertListEqual(expected, nodes)         
-         
+
+    def test_text_to_textnodes_delimiter_inside_code(self):
+        """Tests that delimiters inside a code span are left untouched."""
+        text = "Call `snake_case_name` with **care**"
+        nodes = text_to_textnodes(text)
+        expected = [
+            TextNode("Call ", TextType.TEXT),
+            TextNode("snake_case_name", TextType.CODE),
+            TextNode(" with ", TextType.TEXT),
+            TextNode("care", TextType.BOLD),
+        ]
+        self.assertListEqual(expected, nodes)
+
+    def test_text_to_textnodes_delimiters_inside_link_and_image(self):
+        """Tests that delimiters inside link/image text and URLs are not split."""
+        text = "See [my_page](https://x.com/a_b) and ![**logo**](/img_1.png) _now_"
+        nodes = text_to_textnodes(text)
+        expected = [
+            TextNode("See ", TextType.TEXT),
+            TextNode("my_page", TextType.LINK, "https://x.com/a_b"),
+            TextNode(" and ", TextType.TEXT),
+            TextNode("**logo**", TextType.IMAGE, "/img_1.png"),
+            TextNode(" ", TextType.TEXT),
+            TextNode("now", TextType.ITALIC),
+        ]
+        self.assertListEqual(expected, nodes)
+
+    def test_text_to_textnodes_lone_bracket(self):
+        """Tests that '[' / '![' without link syntax stay plain text."""
+        text = "A [note] and ![no image] then [link](url.com)"
+        nodes = text_to_textnodes(text)
+        expected = [
+            TextNode("A [note] and ![no image] then ", TextType.TEXT),
+            TextNode("link", TextType.LINK, "url.com"),
+        ]
+        self.assertListEqual(expected, nodes)
+
+    def test_text_to_textnodes_unmatched_delimiter(self):
+        """Tests that an unclosed delimiter raises ValueError."""
+        with self.assertRaises(ValueError) as cm:
+            text_to_textnodes("This **bold is not closed")
+        self.assertIn("Unmatched delimiter '**'", str(cm.exception))
+
+    def test_text_to_fields_matches_text_to_textnodes(self):
+        """Tests that text_to_fields yields the TextNodes' fields as tuples."""
+        text = "A **bold** [link](url.com) and ![img](i.png) `code` _it_"
+        fields = text_to_fields(text)
+        self.assertListEqual(
+            [(n.text, n.text_type, n.url) for n in text_to_textnodes(text)],
+            fields,
+        )
+        self.assertIsInstance(fields[0], tuple)
+
+    def test_validate_nodes(self):
+        """Tests validate_nodes compares TextNode sequences node by node."""
+        nodes = text_to_textnodes("A **bold** move")
+        self.assertTrue(validate_nodes(nodes, list(nodes)))
+        self.assertTrue(validate_nodes(tuple(nodes), nodes))
+        self.assertTrue(validate_nodes([], []))
+        self.assertFalse(validate_nodes(nodes, nodes[:-1]))
+        changed = nodes[:-1] + [TextNode(" move", TextType.ITALIC)]
+        self.assertFalse(validate_nodes(nodes, changed))
+
 # Standard boilerplate
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
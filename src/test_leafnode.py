@@ -34,6 +34,8 @@ class TestLeafNode(unittest.TestCase):
         # CORRECTED ORDER: value first, then tag
         node = LeafNode("Bold text", "b")
         self.assertEqual(node.to_html(), "<b>Bold text</b>")
+        # An empty props dict renders the same as no props
+        self.assertEqual(LeafNode("Bold text", "b", {}).to_html(), "<b>Bold text</b>")
 
     # Test case 5: Ensure ValueError is raised if value is None
     def test_to_html_no_value(self):
@@ -45,6 +47,16 @@ class TestLeafNode(unittest.TestCase):
             node.to_html()
         self.assertEqual(str(cm.exception), "Invalid HTML: LeafNode requires a value.")
 
+    def test_clone_with_value(self):
+        """Tests that a clone keeps tag and props but renders its own value."""
+        proto = LeafNode("", "a", {"href": "/x"})
+        self.assertEqual(proto.to_html(), '<a href="/x"></a>')
+        clone = proto._clone_with_value("Go")
+        self.assertIsInstance(clone, LeafNode)
+        self.assertIsNot(clone, proto)
+        self.assertEqual(clone.to_html(), '<a href="/x">Go</a>')
+        self.assertEqual(proto.to_html(), '<a href="/x"></a>')
+
     # Test case 6: Check __repr__
     def test_repr(self):
         """Tests the __repr__ method for LeafNode."""
@@ -0,0 +1,275 @@
+# src/test_main.py
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# Import the build functions to test
+import main
+from main import (
+    _is_up_to_date, collect_page_tasks, generate_page, generator_fingerprint,
+    page_cache_key, prune_page_cache, remove_directory_recursive,
+    store_cached_page,
+)
+
+TEMPLATE = "<title>{{ Title }}</title><a href=\"/x\">{{ Content }}</a>"
+
+
+def _write(path, text=""):
+    """Creates path (and its parent directories) holding text."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _baseline_pages(dir_path_content, dest_dir_path, pages):
+    """
+    The original recursive walk (os.listdir plus isfile/isdir), recording
+    the (markdown_path, html_path) pairs it would have generated.
+    """
+    for item in os.listdir(dir_path_content):
+        full_src_path = os.path.join(dir_path_content, item)
+        if os.path.isfile(full_src_path):
+            if item.lower().endswith(".md"):
+                base_name, _ = os.path.splitext(item)
+                pages.append((full_src_path, os.path.join(dest_dir_path, f"{base_name}.html")))
+        elif os.path.isdir(full_src_path):
+            _baseline_pages(full_src_path, os.path.join(dest_dir_path, item), pages)
+    return pages
+
+
+class TestRemoveDirectoryRecursive(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        self.target = os.path.join(self.root, "docs")
+
+    def test_removes_nested_directories(self):
+        """Tests removal of files and empty and non-empty nested directories."""
+        _write(os.path.join(self.target, "index.html"))
+        _write(os.path.join(self.target, "a", "b", "c", "deep.html"))
+        os.makedirs(os.path.join(self.target, "a", "empty"))
+        remove_directory_recursive(self.target)
+        self.assertFalse(os.path.exists(self.target))
+        self.assertEqual(os.listdir(self.root), [])
+
+    def test_removes_symlinks_not_their_targets(self):
+        """Tests that symlinks are unlinked without touching what they point to."""
+        outside = os.path.join(self.root, "outside")
+        _write(os.path.join(outside, "keep.txt"), "keep")
+        _write(os.path.join(self.target, "index.html"))
+        os.symlink(outside, os.path.join(self.target, "dir_link"))
+        os.symlink(os.path.join(outside, "keep.txt"), os.path.join(self.target, "file_link"))
+        os.symlink(os.path.join(self.root, "gone"), os.path.join(self.target, "dangling"))
+        remove_directory_recursive(self.target)
+        self.assertFalse(os.path.lexists(self.target))
+        self.assertEqual(os.listdir(outside), ["keep.txt"])
+
+    def test_missing_directory_is_ignored(self):
+        """Tests that removing a directory that does not exist does nothing."""
+        remove_directory_recursive(self.target)
+        self.assertFalse(os.path.exists(self.target))
+
+    def test_file_is_not_removed(self):
+        """Tests that a path to a file is reported and left in place."""
+        _write(self.target)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            remove_directory_recursive(self.target)
+        self.assertIn("is not a directory", out.getvalue())
+        self.assertTrue(os.path.isfile(self.target))
+
+
+class TestCollectPageTasks(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        self.content = os.path.join(self.root, "content")
+        self.dest = os.path.join(self.root, "docs")
+
+    def test_follows_symlinked_directories(self):
+        """Tests that pages under a symlinked content directory are collected."""
+        _write(os.path.join(self.content, "index.md"), "# Home")
+        elsewhere = os.path.join(self.root, "elsewhere")
+        _write(os.path.join(elsewhere, "post.md"), "# Post")
+        os.symlink(elsewhere, os.path.join(self.content, "linked"))
+
+        tasks = []
+        collect_page_tasks(self.content, self.dest, tasks)
+        self.assertIn(
+            (os.path.join(self.content, "linked", "post.md"),
+             os.path.join(self.dest, "linked", "post.html")),
+            tasks)
+        self.assertTrue(os.path.isdir(os.path.join(self.dest, "linked")))
+
+    def test_matches_baseline_recursion(self):
+        """Tests that the flat walk yields the same pages as the original recursion."""
+        for rel in ("index.md", "README.MD", "notes.txt",
+                    os.path.join("blog", "index.md"),
+                    os.path.join("blog", "2024", "post.md"),
+                    os.path.join("blog", "2024", "image.png"),
+                    os.path.join("docs.md", "nested.md")): # A directory named *.md
+            _write(os.path.join(self.content, rel), "# Page")
+        os.makedirs(os.path.join(self.content, "drafts", "empty"))
+
+        tasks = []
+        collect_page_tasks(self.content, self.dest, tasks)
+        expected = _baseline_pages(self.content, self.dest, [])
+        self.assertEqual(sorted(tasks), sorted(expected))
+        self.assertIn((os.path.join(self.content, "blog", "2024", "post.md"),
+                       os.path.join(self.dest, "blog", "2024", "post.html")), tasks)
+        self.assertEqual(len(tasks), 5)
+        # Every source directory is mirrored, including ones without pages
+        self.assertTrue(os.path.isdir(os.path.join(self.dest, "drafts", "empty")))
+
+    def test_trailing_separator_on_content_dir(self):
+        """Tests that a trailing separator on the content path gives the same paths."""
+        _write(os.path.join(self.content, "blog", "index.md"), "# Page")
+        tasks = []
+        collect_page_tasks(self.content + os.sep, self.dest, tasks)
+        self.assertEqual([dest for _, dest in tasks],
+                         [os.path.join(self.dest, "blog", "index.html")])
+
+
+class TestIncrementalBuild(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.content = os.path.join(tmp.name, "content")
+        self.dest = os.path.join(tmp.name, "docs")
+        self.source = os.path.join(self.content, "blog", "index.md")
+        self.output = os.path.join(self.dest, "blog", "index.html")
+        # Source and template at t=1000, output generated after them at t=2000
+        _write(self.source, "# Post")
+        _write(self.output, "<h1>Post</h1>")
+        os.utime(self.source, (1000, 1000))
+        os.utime(self.output, (2000, 2000))
+
+    def _collect(self, template_mtime):
+        tasks = []
+        skipped = collect_page_tasks(self.content, self.dest, tasks, template_mtime)
+        return tasks, skipped
+
+    def test_unchanged_source_is_skipped(self):
+        """Tests that a page newer than its source and the template is left out."""
+        self.assertTrue(_is_up_to_date(self.source, self.output, 1000))
+        self.assertEqual(self._collect(1000), ([], 1))
+
+    def test_touched_source_is_rebuilt(self):
+        """Tests that a source modified after its page was written is collected."""
+        os.utime(self.source, (3000, 3000))
+        self.assertFalse(_is_up_to_date(self.source, self.output, 1000))
+        self.assertEqual(self._collect(1000), ([(self.source, self.output)], 0))
+
+    def test_template_change_forces_rebuild(self):
+        """Tests that a template newer than the page forces it to be rebuilt."""
+        self.assertFalse(_is_up_to_date(self.source, self.output, 3000))
+        self.assertEqual(self._collect(3000), ([(self.source, self.output)], 0))
+
+    def test_missing_output_is_built(self):
+        """Tests that a page that was never generated is collected."""
+        os.remove(self.output)
+        self.assertFalse(_is_up_to_date(self.source, self.output, 1000))
+        self.assertEqual(self._collect(1000), ([(self.source, self.output)], 0))
+
+    def test_full_build_collects_everything(self):
+        """Tests that without a template mtime (a full build) nothing is skipped."""
+        self.assertEqual(self._collect(None), ([(self.source, self.output)], 0))
+
+
+class TestPageCache(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = tmp.name
+        self.cache_dir = os.path.join(self.root, "cache")
+        self.source = os.path.join(self.root, "page.md")
+        _write(self.source, "# Hello\n\nSome **bold** text.")
+        # generate_page reads the module global at call time
+        patcher = mock.patch.object(main, "PAGE_CACHE_DIR", self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _generate(self, dest_name, template=TEMPLATE, basepath="/"):
+        """Generates self.source into dest_name, returning the written HTML."""
+        dest = os.path.join(self.root, dest_name)
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_page(self.source, template, dest, basepath)
+        with open(dest, encoding="utf-8") as f:
+            return f.read()
+
+    def _cached_pages(self):
+        return sorted(os.listdir(self.cache_dir))
+
+    def test_generator_fingerprint(self):
+        """Tests that the fingerprint is a stable 32-character hex digest."""
+        digest = generator_fingerprint()
+        self.assertRegex(digest, r"^[0-9a-f]{32}$")
+        self.assertEqual(generator_fingerprint(), digest)
+
+    def test_cache_key_covers_every_input(self):
+        """Tests that the key is stable and changes with each of its inputs."""
+        key = page_cache_key("# A", TEMPLATE, "/")
+        self.assertRegex(key, r"^[0-9a-f]{32}$")
+        self.assertEqual(page_cache_key("# A", TEMPLATE, "/"), key)
+        self.assertNotEqual(page_cache_key("# B", TEMPLATE, "/"), key)
+        self.assertNotEqual(page_cache_key("# A", TEMPLATE + " ", "/"), key)
+        self.assertNotEqual(page_cache_key("# A", TEMPLATE, "/blog/"), key)
+        with mock.patch.object(main, "generator_fingerprint", return_value="0" * 32):
+            self.assertNotEqual(page_cache_key("# A", TEMPLATE, "/"), key)
+
+    def test_cache_hit_skips_rendering(self):
+        """Tests that an unchanged page is copied from the cache, not re-rendered."""
+        first = self._generate("first.html")
+        self.assertEqual(len(self._cached_pages()), 1)
+        with mock.patch.object(main, "render_markdown_to_html_and_title",
+                               side_effect=AssertionError("page was re-rendered")):
+            second = self._generate("second.html")
+        self.assertEqual(second, first)
+        self.assertEqual(len(self._cached_pages()), 1)
+
+    def test_template_or_basepath_change_invalidates(self):
+        """Tests that a new template or basepath renders a fresh page."""
+        original = self._generate("original.html")
+        retemplated = self._generate("retemplated.html", template="<p>{{ Content }}</p>")
+        rebased = self._generate("rebased.html", basepath="/blog/")
+        self.assertNotEqual(retemplated, original)
+        self.assertIn('href="/blog/x"', rebased)
+        self.assertEqual(len(self._cached_pages()), 3)
+
+    def test_store_cached_page(self):
+        """Tests that a stored page is written whole, with no temp file left behind."""
+        cache_path = os.path.join(self.cache_dir, "nested", "key.html")
+        store_cached_page(cache_path, [b"<p>", b"hi", b"</p>"])
+        with open(cache_path, "rb") as f:
+            self.assertEqual(f.read(), b"<p>hi</p>")
+        self.assertEqual(os.listdir(os.path.dirname(cache_path)), ["key.html"])
+
+    def test_prune_keeps_most_recent_entries(self):
+        """Tests pruning down to max_entries, evicting the oldest mtimes first."""
+        os.makedirs(self.cache_dir)
+        for i in range(6):
+            path = os.path.join(self.cache_dir, f"{i}.html")
+            _write(path)
+            os.utime(path, (1000 + i, 1000 + i))
+        _write(os.path.join(self.cache_dir, "notes.txt")) # Not a cache entry
+        prune_page_cache(self.cache_dir, max_entries=2)
+        self.assertEqual(self._cached_pages(), ["4.html", "5.html", "notes.txt"])
+        prune_page_cache(self.cache_dir, max_entries=2) # Already within the cap
+        self.assertEqual(len(self._cached_pages()), 3)
+
+    def test_prune_missing_cache_dir(self):
+        """Tests that pruning a cache that was never created does nothing."""
+        prune_page_cache(os.path.join(self.root, "missing"), max_entries=0)
+
+
+# Standard boilerplate to run tests if the script is executed directly
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,5 @@
+import io
+import sys
 import unittest
 
 from htmlnode import ParentNode, LeafNode # Import necessary classes
@@ -100,6 +102,52 @@ class TestParentNode(unittest.TestCase):
             node.to_html()
         self.assertIn("requires children", str(cm.exception))
 
+    # Test case 9: Rendered HTML is memoized until invalidate()
+    def test_to_html_cached_and_invalidate(self):
+        """Tests that to_html is memoized and invalidate() clears the subtree."""
+        leaf = LeafNode("before", "b")
+        node = ParentNode("p", [leaf])
+        self.assertEqual(node.to_html(), "<p><b>before</b></p>")
+        leaf.value = "after"
+        # Still the memoized render until the tree is invalidated
+        self.assertEqual(node.to_html(), "<p><b>before</b></p>")
+        node.invalidate()
+        self.assertEqual(node.to_html(), "<p><b>after</b></p>")
+
+    # Test case 10: write_to streams the same HTML as to_html
+    def test_write_to(self):
+        """Tests that write_to writes exactly to_html() to a file object."""
+        node = ParentNode("div", [
+            ParentNode("p", [LeafNode("Bold", "b"), LeafNode(" text")]),
+            LeafNode("link", "a", {"href": "/x"}),
+        ], {"class": "c"})
+        buf = io.StringIO()
+        node.write_to(buf)
+        self.assertEqual(buf.getvalue(), node.to_html())
+
+    # Test case 11: Nesting deeper than the recursion limit still renders
+    def test_to_html_deeper_than_recursion_limit(self):
+        """Tests that rendering does not recurse once per nesting level."""
+        depth = sys.getrecursionlimit() + 100
+        node = LeafNode("core", "b")
+        for _ in range(depth):
+            node = ParentNode("span", [node])
+        html = node.to_html()
+        self.assertEqual(html, "<span>" * depth + "<b>core</b>" + "</span>" * depth)
+
+    # Test case 12: Invalidating a tree deeper than the recursion limit
+    def test_invalidate_deeper_than_recursion_limit(self):
+        """Tests that invalidate() walks deep trees without recursing."""
+        depth = sys.getrecursionlimit() + 100
+        leaf = LeafNode("core", "b")
+        node = leaf
+        for _ in range(depth):
+            node = ParentNode("span", [node])
+        node.to_html()
+        leaf.value = "after"
+        node.invalidate()
+        self.assertEqual(node.to_html(), "<span>" * depth + "<b>after</b>" + "</span>" * depth)
+
 # Standard boilerplate to run tests
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
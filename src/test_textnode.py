@@ -1,4 +1,6 @@
 # src/test_textnode.py
+import copy
+import pickle
 import unittest
 from enum import Enum
 
@@ -33,6 +35,37 @@ class TestTextNode(unittest.TestCase):
         node2 = TextNode("Plain text", TextType.TEXT, None)
         self.assertEqual(node, node2)
 
+    def test_textnode_has_no_instance_dict(self):
+        """TextNode uses __slots__, so no per-instance __dict__."""
+        node = TextNode("text", TextType.TEXT)
+        self.assertFalse(hasattr(node, "__dict__"))
+
+    def test_text_type_values(self):
+        """TextType members are named singletons with string values."""
+        self.assertEqual(TextType.BOLD.value, "bold")
+        self.assertEqual(TextType.BOLD.name, "BOLD")
+        self.assertEqual(repr(TextType.BOLD), "TextType.BOLD")
+        self.assertNotEqual(TextType.BOLD, "bold")
+        node = TextNode("x", TextType.BOLD)
+        self.assertEqual(repr(node), "TextNode(x, bold, None)")
+        node.text = "y" # The repr reflects the node's current fields
+        self.assertEqual(repr(node), "TextNode(y, bold, None)")
+
+    def test_module_constants_are_members(self):
+        """The module-level aliases are the TextType singletons themselves."""
+        import textnode
+        for name in ("TEXT", "BOLD", "ITALIC", "CODE", "LINK", "IMAGE"):
+            with self.subTest(name=name):
+                self.assertIs(getattr(textnode, name), getattr(TextType, name))
+                self.assertIn(name, textnode.__all__)
+
+    def test_text_type_survives_pickle_and_copy(self):
+        """Pickling or copying a TextType member yields the same singleton."""
+        for member in (TextType.TEXT, TextType.IMAGE):
+            with self.subTest(member=member):
+                self.assertIs(pickle.loads(pickle.dumps(member)), member)
+                self.assertIs(copy.deepcopy(member), member)
+
     def test_eq_with_url(self):
         node = TextNode("Image node", TextType.IMAGE, "https://image.com/img.png")
         node2 = TextNode("Image node", TextType.IMAGE, "https://image.com/img.png")
@@ -43,72 +76,58 @@ class TestTextNode(unittest.TestCase):
         other = "Just a string"
         self.assertNotEqual(node, other)
 
+    def test_eq_same_object(self):
+        node = TextNode("Some text", TextType.TEXT)
+        self.assertEqual(node, node)
+        self.assertFalse(node != node)
+
+    def test_hash_consistent_with_eq(self):
+        node = TextNode("Link", TextType.LINK, "https://example.com")
+        node2 = TextNode("Link", TextType.LINK, "https://example.com")
+        self.assertEqual(hash(node), hash(node2))
+        # Equal nodes collapse to one dict/set entry
+        self.assertEqual(len({node, node2, TextNode("Link", TextType.TEXT)}), 2)
+        # The hash follows mutation, so it stays consistent with __eq__
+        node.text_type = TextType.TEXT
+        node.url = None
+        self.assertEqual(node, TextNode("Link", TextType.TEXT))
+        self.assertEqual(hash(node), hash(TextNode("Link", TextType.TEXT)))
+
     # --- New tests for text_node_to_html_node ---
 
-    def test_convert_text(self):
-        """Tests conversion of TEXT type."""
-        node = TextNode("Just raw text", TextType.TEXT)
-        html_node = text_node_to_html_node(node)
-        # Expected: LeafNode(value="Just raw text", tag=None)
-        self.assertIsInstance(html_node, LeafNode)
-        self.assertEqual(html_node.value, "Just raw text")
-        self.assertIsNone(html_node.tag)
-        self.assertIsNone(html_node.props)
-
-    def test_convert_bold(self):
-        """Tests conversion of BOLD type."""
-        node = TextNode("Bold content", TextType.BOLD)
-        html_node = text_node_to_html_node(node)
-        # Expected: LeafNode(value="Bold content", tag="b")
-        self.assertIsInstance(html_node, LeafNode)
-        self.assertEqual(html_node.value, "Bold content")
-        self.assertEqual(html_node.tag, "b")
-        self.assertIsNone(html_node.props)
-
-    def test_convert_italic(self):
-        """Tests conversion of ITALIC type."""
-        node = TextNode("Italicized", TextType.ITALIC)
-        html_node = text_node_to_html_node(node)
-        # Expected: LeafNode(value="Italicized", tag="i")
-        self.assertIsInstance(html_node, LeafNode)
-        self.assertEqual(html_node.value, "Italicized")
-        self.assertEqual(html_node.tag, "i")
-        self.assertIsNone(html_node.props)
-
-    def test_convert_code(self):
-        """Tests conversion of CODE type."""
-        node = TextNode("print('hello')", TextType.CODE)
-        html_node = text_node_to_html_node(node)
-        # Expected: LeafNode(value="print('hello')", tag="code")
-        self.assertIsInstance(html_node, LeafNode)
-        self.assertEqual(html_node.value, "print('hello')")
-        self.assertEqual(html_node.tag, "code")
-        self.assertIsNone(html_node.props)
-
-    def test_convert_link(self):
-        """Tests conversion of LINK type."""
+    def test_convert_cases(self):
+        """Tests conversion of each TextType to its LeafNode."""
         url = "https://www.example.com"
-        node = TextNode("Click Here", TextType.LINK, url)
-        html_node = text_node_to_html_node(node)
-        # Expected: LeafNode(value="Click Here", tag="a", props={"href": url})
-        self.assertIsInstance(html_node, LeafNode)
-        self.assertEqual(html_node.value, "Click Here")
-        self.assertEqual(html_node.tag, "a")
-        self.assertIsNotNone(html_node.props)
-        self.assertEqual(html_node.props, {"href": url})
-
-    def test_convert_image(self):
-        """Tests conversion of IMAGE type."""
         img_url = "https://example.com/image.png"
-        alt_text = "An example image"
-        node = TextNode(alt_text, TextType.IMAGE, img_url)
-        html_node = text_node_to_html_node(node)
-        # Expected: LeafNode(value="", tag="img", props={"src": img_url, "alt": alt_text})
-        self.assertIsInstance(html_node, LeafNode)
-        self.assertEqual(html_node.value, "") # Image tag has no value
-        self.assertEqual(html_node.tag, "img")
-        self.assertIsNotNone(html_node.props)
-        self.assertEqual(html_node.props, {"src": img_url, "alt": alt_text})
+        # (text_type, text, url, expected tag, expected value, expected props)
+        cases = [
+            (TextType.TEXT, "Just raw text", None, None, "Just raw text", None),
+            (TextType.BOLD, "Bold content", None, "b", "Bold content", None),
+            (TextType.ITALIC, "Italicized", None, "i", "Italicized", None),
+            (TextType.CODE, "print('hello')", None, "code", "print('hello')", None),
+            (TextType.LINK, "Click Here", url, "a", "Click Here", {"href": url}),
+            # Image tag has no value; the text becomes the alt attribute
+            (TextType.IMAGE, "An example image", img_url, "img", "",
+             {"src": img_url, "alt": "An example image"}),
+        ]
+        for text_type, text, node_url, tag, value, props in cases:
+            with self.subTest(text_type=text_type):
+                html_node = text_node_to_html_node(TextNode(text, text_type, node_url))
+                self.assertIsInstance(html_node, LeafNode)
+                self.assertEqual(html_node.tag, tag)
+                self.assertEqual(html_node.value, value)
+                self.assertEqual(html_node.props, props)
+
+    def test_convert_returns_fresh_leaf(self):
+        """Tests that each conversion builds its own LeafNode from the current node."""
+        node = TextNode("Shared", TextType.BOLD)
+        first = text_node_to_html_node(node)
+        first.value = "Changed" # Mutating a result must not leak into later calls
+        second = text_node_to_html_node(TextNode("Shared", TextType.BOLD))
+        self.assertIsNot(first, second)
+        self.assertEqual(second.to_html(), "<b>Shared</b>")
+        node.text = "Edited" # Nor may a stale result outlive the node's fields
+        self.assertEqual(text_node_to_html_node(node).to_html(), "<b>Edited</b>")
 
     def test_convert_invalid_type(self):
         """Tests that an invalid TextType raises an error."""
@@ -117,32 +136,35 @@ class TestTextNode(unittest.TestCase):
         # Or create a fake enum member if that's easier
         class FakeTextType(Enum):
             FAKE = "fake"
-        node = TextNode("Some text", FakeTextType.FAKE) # Use a type not handled
-        with self.assertRaises(ValueError) as cm:
-            text_node_to_html_node(node)
-        # Check the error message contains something useful
-        self.assertIn("Unsupported text type", str(cm.exception))
-
-    def test_convert_link_no_url(self):
-        """Tests ValueError if LINK type has no URL."""
-        node = TextNode("Link text", TextType.LINK, None)
-        with self.assertRaises(ValueError) as cm:
-            text_node_to_html_node(node)
-        self.assertIn("Link type requires a URL", str(cm.exception))
-
-    def test_convert_image_no_url(self):
-        """Tests ValueError if IMAGE type has no URL."""
-        node = TextNode("Alt text", TextType.IMAGE, None)
-        with self.assertRaises(ValueError) as cm:
+        node = TextNode("Some text", TextType.TEXT)
+        # Swapped in after construction, which only accepts TextType members
+        node.text_type = FakeTextType.FAKE # Use a type not handled
+        with self.assertRaisesRegex(ValueError, r"Unsupported text type"):
             text_node_to_html_node(node)
-        self.assertIn("Image type requires a URL", str(cm.exception))
 
-    def test_convert_image_no_alt(self):
-        """Tests ValueError if IMAGE type has no text (alt text)."""
-        node = TextNode(None, TextType.IMAGE, "http://example.com/img.jpg")
-        with self.assertRaises(ValueError) as cm:
-            text_node_to_html_node(node)
-        self.assertIn("Image type requires text (alt text)", str(cm.exception))
+    @unittest.skipUnless(__debug__, "the check is stripped under python -O")
+    def test_init_rejects_non_text_type(self):
+        """Tests TypeError if a TextNode is built with a non-TextType type."""
+        with self.assertRaisesRegex(TypeError, r"text_type must be a TextType member"):
+            TextNode("Some text", "bold")
+
+    def test_convert_non_textnode(self):
+        """Tests TypeError if the argument is not a TextNode."""
+        with self.assertRaisesRegex(TypeError, r"Expected a TextNode object"):
+            text_node_to_html_node(LeafNode("Already HTML", "b"))
+
+    def test_convert_missing_fields(self):
+        """Tests ValueError if a LINK/IMAGE node lacks its URL or alt text."""
+        cases = [
+            (TextNode("Link text", TextType.LINK, None), r"Link type requires a URL"),
+            (TextNode("Alt text", TextType.IMAGE, None), r"Image type requires a URL"),
+            (TextNode(None, TextType.IMAGE, "http://example.com/img.jpg"),
+             r"Image type requires text \(alt text\)"),
+        ]
+        for node, message in cases:
+            with self.subTest(node=node):
+                with self.assertRaisesRegex(ValueError, message):
+                    text_node_to_html_node(node)
 
 # Standard boilerplate to run tests if the script is executed directly
 if __name__ == "__main__":
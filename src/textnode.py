@@ -1,38 +1,163 @@
 # src/textnode.py
-from enum import Enum
+from collections.abc import Callable
+from typing import ClassVar
 # Import LeafNode from the htmlnode module
 from htmlnode import LeafNode
 
-class TextType(Enum):
-    TEXT = "text"
-    BOLD = "bold"
-    ITALIC = "italic"
-    CODE = "code"
-    LINK = "link"
-    IMAGE = "image"
+__all__ = [
+    "TextType", "TextNode", "text_node_to_html_node",
+    "TEXT", "BOLD", "ITALIC", "CODE", "LINK", "IMAGE",
+]
+
+class TextType:
+    """
+    The kind of inline text a TextNode holds.
+
+    A closed set of singletons (TextType.TEXT, .BOLD, ...) rather than an
+    enum.Enum: comparison and hashing use the default identity methods,
+    which run in C, so `is`/`==` checks and dict lookups keyed on a text
+    type skip Enum's Python-level machinery.
+    """
+    # The members, created once the class exists (see below)
+    TEXT: ClassVar["TextType"]
+    BOLD: ClassVar["TextType"]
+    ITALIC: ClassVar["TextType"]
+    CODE: ClassVar["TextType"]
+    LINK: ClassVar["TextType"]
+    IMAGE: ClassVar["TextType"]
+
+    __slots__ = ("name", "value", "_to_html_node")
+    name: str
+    value: str
+    # This type's TextNode -> LeafNode builder (attached below, once the
+    # builders are defined; see text_node_to_html_node)
+    _to_html_node: Callable[["TextNode"], LeafNode]
+
+    def __init__(self, name: str, value: str) -> None:
+        self.name = name # Attribute name on the class, e.g. "BOLD"
+        self.value = value # Lower-case label, e.g. "bold"
+
+    def __repr__(self):
+        return f"TextType.{self.name}"
+
+    def __reduce__(self):
+        # Pickle/copy by name, so a member stays the same singleton
+        # (e.g. when sent to or from a worker process)
+        return (getattr, (TextType, self.name))
+
+TextType.TEXT = TextType("TEXT", "text")
+TextType.BOLD = TextType("BOLD", "bold")
+TextType.ITALIC = TextType("ITALIC", "italic")
+TextType.CODE = TextType("CODE", "code")
+TextType.LINK = TextType("LINK", "link")
+TextType.IMAGE = TextType("IMAGE", "image")
+
+# The members as module constants: `from textnode import BOLD` lets hot
+# callers load a global instead of a class attribute each time
+TEXT, BOLD, ITALIC, CODE, LINK, IMAGE = (
+    TextType.TEXT, TextType.BOLD, TextType.ITALIC,
+    TextType.CODE, TextType.LINK, TextType.IMAGE,
+)
 
 class TextNode:
-    # ... (Existing TextNode class code) ...
+    # No per-instance __dict__: the inline parser creates many of these
+    __slots__ = ("text", "text_type", "url")
+
     def __init__(self, text, text_type, url=None):
+        # Typed construction: text_type must be a TextType member. Checked
+        # with a pointer compare, and stripped entirely under `python -O`.
+        if __debug__ and text_type.__class__ is not TextType:
+            raise TypeError(f"text_type must be a TextType member, got {text_type!r}")
         self.text = text
         self.text_type = text_type
         self.url = url
 
     def __eq__(self, other):
-        if not isinstance(other, TextNode):
-            return False
+        # Identity first: a node compared with itself is always equal
+        if other is self:
+            return True
+        # Exact-class pointer compare; NotImplemented lets Python try the
+        # other operand (and fall back to False for unrelated types)
+        if other.__class__ is not TextNode:
+            return NotImplemented
+        # Chained compares, cheapest first (text types are singletons); this
+        # measured faster than building and comparing two field tuples
         return (
+            self.text_type is other.text_type and
             self.text == other.text and
-            self.text_type == other.text_type and
             self.url == other.url
         )
 
+    def __hash__(self):
+        # Hashable (consistent with __eq__) so equal nodes can share a
+        # dict/set entry, e.g. to convert each distinct span only once.
+        # Not cached: the fields are mutable, so it must follow them.
+        return hash((self.text_type, self.text, self.url))
+
     def __repr__(self):
-        tt_value = self.text_type.value if isinstance(self.text_type, Enum) else self.text_type
-        return f"TextNode({self.text}, {tt_value}, {self.url})"
+        return f"TextNode({self.text}, {self.text_type.value}, {self.url})"
 
 # --- Add the conversion function below ---
 
+# Error messages, built once at import rather than at each raise
+_ERR_LINK_NO_URL = "Invalid TextNode: Link type requires a URL."
+_ERR_IMAGE_NO_URL = "Invalid TextNode: Image type requires a URL (src)."
+_ERR_IMAGE_NO_ALT = "Invalid TextNode: Image type requires text (alt text)."
+_ERR_UNSUPPORTED_TYPE = "Unsupported text type: {}"
+
+# One builder per TextType, each building its LeafNode with no branching
+# on the type (LeafNode constructor: value, tag=None, props=None).
+# _LeafNode=LeafNode binds the class as a local (LOAD_FAST) instead of a
+# module-global lookup on every call.
+#
+# The tag-only types clone a prototype node instead: it differs from the
+# result only in its value, and cloning skips LeafNode.__init__.
+_TEXT_PROTO = LeafNode("") # tag defaults to None
+_BOLD_PROTO = LeafNode("", "b")
+_ITALIC_PROTO = LeafNode("", "i")
+_CODE_PROTO = LeafNode("", "code")
+# Build the (empty) attribute strings now, so every clone inherits them
+for _proto in (_TEXT_PROTO, _BOLD_PROTO, _ITALIC_PROTO, _CODE_PROTO):
+    _proto.props_to_html()
+del _proto
+
+def _text_to_html_node(text_node, _clone=_TEXT_PROTO._clone_with_value):
+    return _clone(text_node.text)
+
+def _bold_to_html_node(text_node, _clone=_BOLD_PROTO._clone_with_value):
+    return _clone(text_node.text)
+
+def _italic_to_html_node(text_node, _clone=_ITALIC_PROTO._clone_with_value):
+    return _clone(text_node.text)
+
+def _code_to_html_node(text_node, _clone=_CODE_PROTO._clone_with_value):
+    return _clone(text_node.text)
+
+def _link_to_html_node(text_node, _LeafNode=LeafNode):
+    """Builds the <a> LeafNode for a LINK TextNode."""
+    if text_node.url is None:
+        raise ValueError(_ERR_LINK_NO_URL)
+    # LeafNode constructor: value, tag, props
+    return _LeafNode(text_node.text, "a", {"href": text_node.url})
+
+def _image_to_html_node(text_node, _LeafNode=LeafNode):
+    """Builds the <img> LeafNode for an IMAGE TextNode."""
+    if text_node.url is None:
+        raise ValueError(_ERR_IMAGE_NO_URL)
+    if text_node.text is None: # Alt text is technically optional but good practice
+         raise ValueError(_ERR_IMAGE_NO_ALT)
+    # LeafNode constructor: value="", tag="img", props={...}
+    return _LeafNode("", "img", {"src": text_node.url, "alt": text_node.text})
+
+# Each member carries its own builder: dispatch is one attribute load,
+# with no hash lookup or if/elif chain of type comparisons.
+TextType.TEXT._to_html_node = _text_to_html_node
+TextType.BOLD._to_html_node = _bold_to_html_node
+TextType.ITALIC._to_html_node = _italic_to_html_node
+TextType.CODE._to_html_node = _code_to_html_node
+TextType.LINK._to_html_node = _link_to_html_node
+TextType.IMAGE._to_html_node = _image_to_html_node
+
 def text_node_to_html_node(text_node):
     """
     Converts a TextNode object into an HTMLNode (specifically a LeafNode)
@@ -45,35 +170,18 @@ def text_node_to_html_node(text_node):
         LeafNode: The corresponding LeafNode representation.
 
     Raises:
-        Exception: If the text_node has an invalid or unsupported text_type.
-        # Consider using ValueError for more specific error handling
+        TypeError: If text_node is not a TextNode.
+        ValueError: If the text_node has an invalid or unsupported text_type,
+                    or a LINK/IMAGE node lacks its URL (or alt text).
     """
-    if not isinstance(text_node, TextNode):
+    # Exact-class check: a pointer compare, no isinstance() MRO walk
+    # (TextNode is not subclassed)
+    if text_node.__class__ is not TextNode:
          raise TypeError(f"Expected a TextNode object, but got {type(text_node)}")
 
-    tt = text_node.text_type
-
-    if tt == TextType.TEXT:
-        # LeafNode constructor: value, tag=None, props=None
-        return LeafNode(text_node.text) # tag defaults to None
-    elif tt == TextType.BOLD:
-        return LeafNode(text_node.text, "b")
-    elif tt == TextType.ITALIC:
-        return LeafNode(text_node.text, "i")
-    elif tt == TextType.CODE:
-        return LeafNode(text_node.text, "code")
-    elif tt == TextType.LINK:
-        if text_node.url is None:
-            raise ValueError("Invalid TextNode: Link type requires a URL.")
-        # LeafNode constructor: value, tag, props
-        return LeafNode(text_node.text, "a", {"href": text_node.url})
-    elif tt == TextType.IMAGE:
-        if text_node.url is None:
-            raise ValueError("Invalid TextNode: Image type requires a URL (src).")
-        if text_node.text is None: # Alt text is technically optional but good practice
-             raise ValueError("Invalid TextNode: Image type requires text (alt text).")
-        # LeafNode constructor: value="", tag="img", props={...}
-        return LeafNode("", "img", {"src": text_node.url, "alt": text_node.text})
-    else:
-        # Handle unknown types
-        raise ValueError(f"Unsupported text type: {text_node.text_type}")
\ No newline at end of file
+    try:
+        builder = text_node.text_type._to_html_node
+    except AttributeError:
+        # Handle unknown types (anything that is not a TextType member)
+        raise ValueError(_ERR_UNSUPPORTED_TYPE.format(text_node.text_type)) from None
+    return builder(text_node)